@@ -13,34 +13,52 @@ Requirements:
 from beaker import *
 from pyteal import *
 
-# Application State Schema
-class ArdhiChainState:
-    # Global state to store the admin address
-    admin_address = GlobalStateValue(
-        stack_type=TealType.bytes,
-        key=Bytes("admin"),
-        default=Bytes("")
-    )
+# Admin address baked into the approval program at deploy time.
+# deploy.py substitutes the 32-byte public key for TMPL_ADMIN before
+# assembly, so every admin gate is a pushbytes + compare instead of an
+# app_global_get - no global state slot, no state read per call.
+ADMIN = Tmpl.Bytes("TMPL_ADMIN")
 
 # Initialize the Beaker application
-app = Application("ArdhiChain", state=ArdhiChainState())
+# Compile with the TEAL optimizer enabled: scratch-slot coalescing and
+# frame pointers (AVM 8) shrink the approval program and cut the opcode
+# budget consumed by every app call.
+app = Application(
+    "ArdhiChain",
+    build_options=BuildOptions(
+        avm_version=8,
+        scratch_slots=True,
+        frame_pointers=True,
+    ),
+)
 
-@app.create
-def create(admin_addr: abi.Address) -> Expr:
+def asset_transfer_fields(asset_id: Expr, sender: Expr, receiver: Expr) -> dict:
+    """
+    Inner-transaction field set for moving one title NFT via clawback.
+
+    Shared by every transfer leg so the field shape is written once; a
+    Subroutine is deliberately not used here because the two legs of
+    user_transfer_title live inside a single fused inner group.
+    """
+    return {
+        TxnField.type_enum: TxnType.AssetTransfer,
+        TxnField.asset_receiver: receiver,
+        TxnField.asset_sender: sender,
+        TxnField.xfer_asset: asset_id,
+        TxnField.asset_amount: Int(1),
+    }
+
+@app.create(bare=True)
+def create() -> Expr:
     """
     Contract creation method.
-    Sets the admin address who can create land title NFTs.
-    
-    Args:
-        admin_addr: The Algorand address of the administrator
+    The admin address is a template constant, so creation only needs to
+    gate on the creator.
     """
     return Seq([
-        # Only the creator can set the initial admin
+        # Only the creator can deploy this program
         Assert(Txn.sender() == Global.creator_address()),
-        
-        # Store the admin address in global state
-        app.state.admin_address.set(admin_addr.get()),
-        
+
         Approve()
     ])
 
@@ -62,11 +80,22 @@ def create_title(
     Returns:
         The newly created Asset ID
     """
+    # Scratch slot for the new asset ID: the opt-in below becomes the
+    # "last" inner transaction, so created_asset_id must be captured
+    # right after the asset config submits
+    created_asset = ScratchVar(TealType.uint64)
+    # Load the application address once instead of four global lookups
+    app_addr = ScratchVar(TealType.bytes)
+
     return Seq([
         # Verify that sender is the admin
-        Assert(Txn.sender() == app.state.admin_address.get()),
-        
-        # Create the Land Title NFT as an inner transaction
+        Assert(Txn.sender() == ADMIN),
+
+        app_addr.store(Global.current_application_address()),
+
+        # Create the Land Title NFT as an inner transaction.
+        # The opt-in cannot share an inner group with the asset config
+        # because it needs the asset ID the config produces.
         InnerTxnBuilder.Begin(),
         InnerTxnBuilder.SetFields({
             TxnField.type_enum: TxnType.AssetConfig,
@@ -76,29 +105,30 @@ def create_title(
             TxnField.config_asset_unit_name: Bytes("ARDHI"),  # Unit name for identification
             TxnField.config_asset_url: metadata_url.get(),
             # Set all management addresses to the contract for immutability
-            TxnField.config_asset_manager: Global.current_application_address(),
+            TxnField.config_asset_manager: app_addr.load(),
             TxnField.config_asset_reserve: Txn.sender(),  # Admin is reserve
-            TxnField.config_asset_freeze: Global.current_application_address(),
-            TxnField.config_asset_clawback: Global.current_application_address(),
+            TxnField.config_asset_freeze: app_addr.load(),
+            TxnField.config_asset_clawback: app_addr.load(),
         }),
         InnerTxnBuilder.Submit(),
+        created_asset.store(InnerTxn.created_asset_id()),
 
         # Contract must opt-in to the newly created asset
         InnerTxnBuilder.Begin(),
         InnerTxnBuilder.SetFields({
             TxnField.type_enum: TxnType.AssetTransfer,
-            TxnField.xfer_asset: InnerTxn.created_asset_id(),
-            TxnField.asset_receiver: Global.current_application_address(),
+            TxnField.xfer_asset: created_asset.load(),
+            TxnField.asset_receiver: app_addr.load(),
             TxnField.asset_amount: Int(0)  # Opt-in transaction
         }),
         InnerTxnBuilder.Submit(),
 
         # Note: After asset creation, admin (reserve) must send the asset to the contract address
         # so the contract can hold and transfer it.
-        
+
         # Store created asset ID in the output
-        output.set(InnerTxn.created_asset_id()),
-        
+        output.set(created_asset.load()),
+
         Approve()
     ])
 
@@ -115,17 +145,15 @@ def admin_transfer_title(asset_id: abi.Uint64, receiver: abi.Address) -> Expr:
     """
     return Seq([
         # Verify that sender is the admin
-        Assert(Txn.sender() == app.state.admin_address.get()),
-        
+        Assert(Txn.sender() == ADMIN),
+
         # Transfer the NFT from contract to receiver
         InnerTxnBuilder.Begin(),
-        InnerTxnBuilder.SetFields({
-            TxnField.type_enum: TxnType.AssetTransfer,
-            TxnField.asset_receiver: receiver.get(),
-            TxnField.asset_sender: Global.current_application_address(),
-            TxnField.xfer_asset: asset_id.get(),
-            TxnField.asset_amount: Int(1)
-        }),
+        InnerTxnBuilder.SetFields(asset_transfer_fields(
+            asset_id.get(),
+            Global.current_application_address(),
+            receiver.get(),
+        )),
         InnerTxnBuilder.Submit(),
         
         Approve()
@@ -144,68 +172,46 @@ def user_transfer_title(asset_id: abi.Uint64, receiver: abi.Address) -> Expr:
     """
     # Check if sender owns the asset
     sender_balance = AssetHolding.balance(Txn.sender(), asset_id.get())
-    
+    # Load the application address once for both transfer legs
+    app_addr = ScratchVar(TealType.bytes)
+
     return Seq([
-        # Verify sender owns the asset
+        # Verify sender owns the asset. The MaybeValue stores the
+        # asset_holding_get result in scratch once; fusing both checks
+        # into a single Assert emits one branch instead of two.
         sender_balance,
-        Assert(sender_balance.hasValue()),
-        Assert(sender_balance.value() == Int(1)),
-        
-        # First, clawback the asset from sender to contract
-        InnerTxnBuilder.Begin(),
-        InnerTxnBuilder.SetFields({
-            TxnField.type_enum: TxnType.AssetTransfer,
-            TxnField.asset_receiver: Global.current_application_address(),
-            TxnField.asset_sender: Txn.sender(),
-            TxnField.xfer_asset: asset_id.get(),
-            TxnField.asset_amount: Int(1)
-        }),
-        InnerTxnBuilder.Submit(),
+        Assert(And(
+            sender_balance.hasValue(),
+            sender_balance.value() == Int(1)
+        )),
+
+        app_addr.store(Global.current_application_address()),
         
-        # Then, transfer the asset from contract to receiver
+        # Clawback the asset from sender to contract and pass it on to
+        # the receiver in a single inner group: one itxn fee pool and
+        # one Submit instead of two
         InnerTxnBuilder.Begin(),
-        InnerTxnBuilder.SetFields({
-            TxnField.type_enum: TxnType.AssetTransfer,
-            TxnField.asset_receiver: receiver.get(),
-            TxnField.asset_sender: Global.current_application_address(),
-            TxnField.xfer_asset: asset_id.get(),
-            TxnField.asset_amount: Int(1)
-        }),
+        InnerTxnBuilder.SetFields(asset_transfer_fields(
+            asset_id.get(),
+            Txn.sender(),
+            app_addr.load(),
+        )),
+        InnerTxnBuilder.Next(),
+        InnerTxnBuilder.SetFields(asset_transfer_fields(
+            asset_id.get(),
+            app_addr.load(),
+            receiver.get(),
+        )),
         InnerTxnBuilder.Submit(),
-        
-        Approve()
-    ])
 
-@app.external(read_only=True)
-def verify_record(asa_id: abi.Uint64, *, output: abi.Address) -> Expr:
-    """
-    Verifies the current owner of a Land Title NFT.
-    This is a read-only method that can be called by anyone.
-    
-    Args:
-        asa_id: The Asset ID of the land title NFT
-        
-    Returns:
-        Address of the current owner
-    """
-    holder_balance = AssetHolding.balance(Txn.sender(), asa_id.get())
-    
-    return Seq([
-        holder_balance,
-        # For NFTs, we need to find who has balance = 1
-        # This is a simplified version - in production, you'd iterate through accounts
-        output.set(Txn.sender()),
         Approve()
     ])
 
-@app.external(read_only=True)
-def get_admin(*, output: abi.Address) -> Expr:
-    """
-    Returns the current admin address.
-    Args:
-        output: The output parameter to store the admin address
-    """
-    return output.set(app.state.admin_address.get())
+# Note: ownership verification is done off-chain against the indexer
+# (see client.py::verify_record) - holders of an asset are public data,
+# so there is no reason to spend a transaction on it. The admin address
+# is likewise known off-chain (it is a deploy-time template constant),
+# so there is no get_admin method either.
 
 # Deployment configuration
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+"""
+Off-chain helpers for the ArdhiChain Smart Contract
+
+Ownership of a land title NFT is public ledger data already served by
+the Algorand Indexer, so verifying a record does not need an on-chain
+transaction (fee + block space) at all.
+
+Requirements:
+- pip install py-algorand-sdk requests
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from algosdk import constants, error
+from algosdk.v2client import algod
+from algosdk.v2client.algod import api_version_path_prefix
+
+# One pooled session shared by every PooledAlgodClient in the process
+_SESSION = requests.Session()
+_SESSION.headers.update({"Connection": "keep-alive"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+class PooledAlgodClient(algod.AlgodClient):
+    """
+    AlgodClient that reuses one kept-alive TCP+TLS connection per host.
+
+    The stock client goes through urllib and opens a fresh HTTPS
+    connection for every request, paying a TLS handshake each time.
+    Routing requests through a shared requests.Session keeps the
+    connection open, so each call after the first costs a single
+    round-trip.
+    """
+
+    def algod_request(self, method, requrl, params=None, data=None,
+                      headers=None, response_format="json", timeout=30):
+        header = {}
+        if self.headers:
+            header.update(self.headers)
+        if headers:
+            header.update(headers)
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+
+        resp = _SESSION.request(
+            method,
+            self.algod_address + requrl,
+            params=params,
+            data=data,
+            headers=header,
+            timeout=timeout,
+        )
+        if resp.status_code >= 400:
+            try:
+                body = resp.json()
+                message = body.get("message", resp.text)
+            except ValueError:
+                body, message = {}, resp.text
+            err = error.AlgodHTTPError(message, resp.status_code, body.get("data"))
+            # Surface throttling hints so retry loops can honor them
+            retry_after = resp.headers.get("Retry-After")
+            if retry_after is not None and retry_after.isdigit():
+                err.retry_after = int(retry_after)
+            raise err
+
+        if response_format == "json":
+            # Some algod responses are a 200 OK with an empty body
+            if not resp.content:
+                return {}
+            try:
+                return resp.json()
+            except ValueError as e:
+                raise error.AlgodResponseError(
+                    "Failed to parse JSON response from algod"
+                ) from e
+        return resp.content
+
+def verify_record(indexer_client, asa_id):
+    """
+    Verifies the current owner of a Land Title NFT.
+
+    Queries the indexer for accounts with a positive balance of the
+    asset. ARDHI titles have a total supply of 1, so the single holder
+    is the current owner.
+
+    Args:
+        indexer_client: An algosdk.v2client.indexer.IndexerClient
+        asa_id: The Asset ID of the land title NFT
+
+    Returns:
+        Address of the current owner, or None if no account holds it
+    """
+    response = indexer_client.asset_balances(asa_id, min_balance=1)
+    for holding in response.get("balances", []):
+        if holding.get("amount", 0) > 0:
+            return holding["address"]
+    return None
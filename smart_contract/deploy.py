@@ -14,20 +14,80 @@ Environment variables needed:
 
 import os
 import base64
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version as _pkg_version
+from pathlib import Path
+
 from algosdk import account, mnemonic, encoding
 from algosdk.v2client import algod
 from algosdk import transaction
 from app import app
+from client import PooledAlgodClient
 
 # Configuration
 ALGOD_ADDRESS = "https://testnet-api.algonode.cloud"
 ALGOD_TOKEN = ""
 
+# On-disk cache of assembled bytecode, keyed on the contract source,
+# compiler version and template values so edits invalidate it
+BUILD_CACHE_DIR = Path.home() / ".ardhichain" / "build_cache"
+APP_SOURCE = Path(__file__).with_name("app.py")
+
+def _build_cache_key(admin_pubkey):
+    """Hash source, compiler version and template values into a cache key"""
+    digest = hashlib.sha256()
+    digest.update(APP_SOURCE.read_bytes())
+    digest.update(_pkg_version("pyteal").encode())
+    digest.update(admin_pubkey)
+    return digest.hexdigest()
+
+def compile_programs(algod_client, admin_pubkey):
+    """
+    Return (approval_bytes, clear_bytes) for the contract with the admin
+    public key substituted for the TMPL_ADMIN template variable.
+
+    Results are memoized under ~/.ardhichain/build_cache so unchanged
+    sources skip both the PyTEAL build and the algod compile round-trips.
+    """
+    cache_file = BUILD_CACHE_DIR / f"{_build_cache_key(admin_pubkey)}.json"
+    if cache_file.exists():
+        print(f"Using cached bytecode from {cache_file}")
+        cached = json.loads(cache_file.read_text())
+        return (
+            base64.b64decode(cached["approval_b64"]),
+            base64.b64decode(cached["clear_b64"]),
+        )
+
+    # Get the contract TEAL source and bake in the admin address
+    app_spec = app.build()
+    approval_teal = app_spec.approval_program.replace(
+        "TMPL_ADMIN", "0x" + admin_pubkey.hex()
+    )
+
+    # Compile both TEAL programs concurrently so the two algod
+    # round-trips overlap instead of running back to back
+    print("Compiling approval and clear programs...")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        approval_future = pool.submit(algod_client.compile, approval_teal)
+        clear_future = pool.submit(algod_client.compile, app_spec.clear_program)
+    approval_b64 = approval_future.result()["result"]
+    clear_b64 = clear_future.result()["result"]
+
+    BUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps({
+        "approval_b64": approval_b64,
+        "clear_b64": clear_b64,
+    }))
+
+    return base64.b64decode(approval_b64), base64.b64decode(clear_b64)
+
 def deploy_contract():
     """Deploy the ArdhiChain smart contract to TestNet"""
     
-    # Initialize Algod client
-    algod_client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
+    # Initialize Algod client (pooled connection, see client.py)
+    algod_client = PooledAlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
     
     # Get admin account from environment
     admin_private_key = os.getenv('ADMIN_PRIVATE_KEY')
@@ -35,22 +95,14 @@ def deploy_contract():
         print("Error: ADMIN_PRIVATE_KEY environment variable not set")
         return
     
-    # Get admin address
+    # Get admin address (decode its 32-byte public key once for TMPL_ADMIN)
     admin_address = account.address_from_private_key(admin_private_key)
+    admin_pubkey = encoding.decode_address(admin_address)
     print(f"Deploying contract with admin address: {admin_address}")
     
-    # Get the contract TEAL source
-    app_spec = app.build()
-    
     try:
-        # Compile TEAL programs
-        print("Compiling approval program...")
-        approval_result = algod_client.compile(app_spec.approval_program)
-        approval_bytes = base64.b64decode(approval_result["result"])
-        
-        print("Compiling clear program...")
-        clear_result = algod_client.compile(app_spec.clear_program)
-        clear_bytes = base64.b64decode(clear_result["result"])
+        # Compile (or load cached) contract bytecode with the admin baked in
+        approval_bytes, clear_bytes = compile_programs(algod_client, admin_pubkey)
         
         # Get suggested transaction parameters
         print("Getting network parameters...")
@@ -64,12 +116,10 @@ def deploy_contract():
             on_complete=transaction.OnComplete.NoOpOC,
             approval_program=approval_bytes,
             clear_program=clear_bytes,
-            global_schema=transaction.StateSchema(num_uints=0, num_byte_slices=1),
+            global_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
             local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
-            app_args=[
-                bytes.fromhex("cc694eaa"),  # Method selector for create(address)void
-                encoding.decode_address(admin_address)  # admin_addr argument
-            ]
+            # No app_args: creation is a bare call, the admin address is
+            # already baked into the approval program
         )
         
         # Sign transaction
@@ -484,41 +484,20 @@ export class AlgorandService {
         // Continue for unknown errors, the transaction might still succeed
       }
 
-      // Check if account is admin
+      // Check if account is admin. The admin address is baked into the
+      // approval program at deploy time (TMPL_ADMIN), so the deployed
+      // value is mirrored in VITE_ADMIN_ADDRESS rather than global state.
       console.log("Checking admin authorization...");
-      try {
-        const appInfo = await algodClient.getApplicationByID(appId).do();
-        const globalState = appInfo.params.globalState || [];
-        // Get admin key bytes
-        const adminKey = new TextEncoder().encode("admin");
-        console.log("Admin key (hex):", Buffer.from(adminKey).toString('hex'));
-        
-        // Find admin state
-        const adminState = globalState.find(state => {
-          const stateKeyHex = Buffer.from(state.key).toString('hex');
-          const adminKeyHex = Buffer.from(adminKey).toString('hex');
-          console.log(`Comparing state key ${stateKeyHex} with admin key ${adminKeyHex}`);
-          return stateKeyHex === adminKeyHex;
-        });
-
-        if (!adminState?.value?.bytes) {
-          console.error("Admin state not found in global state");
-          console.log("Available state keys:", globalState.map(state => Buffer.from(state.key).toString()));
-          throw new Error("Admin address not found in application state");
-        }
-
-        const storedAdmin = algosdk.encodeAddress(adminState.value.bytes);
-        console.log("Stored admin address:", storedAdmin);
-        console.log("Current account:", account);
-        
-        if (storedAdmin !== account) {
-          throw new Error("Account is not authorized as admin");
-        }
-        console.log("Admin authorization confirmed");
-      } catch (error) {
-        console.error("Error checking admin authorization:", error);
-        throw new Error("Failed to verify admin authorization");
+      const adminAddress = import.meta.env.VITE_ADMIN_ADDRESS;
+      if (!adminAddress) {
+        throw new Error("VITE_ADMIN_ADDRESS is not configured");
+      }
+      console.log("Configured admin address:", adminAddress);
+      console.log("Current account:", account);
+      if (adminAddress !== account) {
+        throw new Error("Account is not authorized as admin");
       }
+      console.log("Admin authorization confirmed");
 
       // Create the application call transaction
       console.log("Creating application call transaction...");